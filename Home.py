@@ -1,6 +1,11 @@
+import io
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+import orjson
+from api_client import API_URL, get_http
 
 # Configure the page
 st.set_page_config(page_title="Items Dashboard", layout="wide")
@@ -8,9 +13,16 @@ st.set_page_config(page_title="Items Dashboard", layout="wide")
 # Initialize session state
 if 'cursor' not in st.session_state:
     st.session_state.cursor = None
+if 'rows' not in st.session_state:
+    st.session_state.rows = []
+if 'rows_limit' not in st.session_state:
+    st.session_state.rows_limit = None
 
-# Configure API URL
-API_URL = "https://dynamo-api.dataknowsall.com"
+# Columns shown in the table; only these attributes are requested from the API
+COLUMNS = ["id", "name", "description"]
+# Arrow schema for the table; attributes missing from an item become nulls and
+# other values are shown as text (see to_table)
+SCHEMA = pa.schema([(column, pa.string()) for column in COLUMNS])
 
 # Sidebar controls
 with st.sidebar:
@@ -34,55 +46,126 @@ with st.sidebar:
             help="Number of items to fetch per request (V1 API only)"
         )
 
+    # Cap the rows sent to the browser; the full set is still downloadable
+    max_rows = st.number_input(
+        "Max rows to display",
+        min_value=100,
+        max_value=100000,
+        value=1000,
+        help="Larger result sets can be downloaded as Parquet"
+    )
+
 # Add title and description
 st.title("Items Dashboard")
 st.markdown("View and manage items from the database")
 
-# Fetch items from API
-try:
-    if api_version == "Base":
-        # Base API call
-        response = requests.get(f"{API_URL}/items")
-        response.raise_for_status()
-        items = response.json()
-    else:
-        # V1 API call with cursor-based pagination
-        response = requests.get(
-            f"{API_URL}/v1/items",
-            params={
-                "limit": limit,
-                "cursor": st.session_state.cursor
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        items = data["items"]
-        st.session_state.cursor = data.get("next_cursor")
-    
-    if items:
-        # Convert items to DataFrame
-        df = pd.DataFrame(items)
-        df = df[["id", "name", "description"]]
-        
-        # Display items in a table
-        st.dataframe(df, use_container_width=True)
-        
-        # Navigation controls (only for V1)
-        if api_version == "V1":
-            col1, col2 = st.columns([4, 1])
-            
-            with col2:
-                if st.session_state.cursor:
-                    if st.button("Load More →"):
-                        st.rerun()
-                elif len(items) >= limit:
-                    st.info("All items loaded")
-                else:
-                    st.info("No more items")
-    else:
-        st.info("No items found in the database.")
-        
-except requests.RequestException as e:
-    st.error(f"Error accessing API: {str(e)}")
-except Exception as e:
-    st.error(f"An error occurred: {str(e)}")
+
+@st.cache_data(ttl=60, show_spinner="Loading items…")
+def fetch_items():
+    """Fetch all items from the Base API, cached for 60s"""
+    # Requested as NDJSON and decoded a line at a time; the full list is still
+    # built here because st.cache_data caches the return value
+    response = get_http().get(
+        f"{API_URL}/items",
+        params={"fields": ",".join(COLUMNS)},
+        headers={"Accept": "application/x-ndjson"},
+        stream=True,
+        timeout=5
+    )
+    response.raise_for_status()
+    return [orjson.loads(line) for line in response.iter_lines() if line]
+
+
+@st.cache_data(ttl=300, show_spinner="Loading items…")
+def fetch_page(limit, cursor):
+    """Fetch one V1 page, cached per (limit, cursor) for 5 minutes"""
+    response = get_http().get(
+        f"{API_URL}/v1/items",
+        params={
+            "limit": limit,
+            "cursor": cursor,
+            "fields": ",".join(COLUMNS)
+        },
+        timeout=5
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def load_page(limit, cursor):
+    """Append the page at cursor to the accumulated rows"""
+    data = fetch_page(limit, cursor)
+    st.session_state.rows.extend(data["items"])
+    st.session_state.cursor = data.get("next_cursor")
+
+
+def to_table(items):
+    """Build the Arrow table shown in the dashboard from API items"""
+    # DynamoDB is schemaless, so any column may also hold numbers or nested
+    # values; render those as text rather than failing the string schema
+    columns = {
+        column: [
+            value if value is None or isinstance(value, str) else str(value)
+            for value in (item.get(column) for item in items)
+        ]
+        for column in COLUMNS
+    }
+    return pa.Table.from_pydict(columns, schema=SCHEMA)
+
+
+@st.fragment
+def items_view(api_version, limit, max_rows):
+    """Fetch and display the items; "Load More" reruns only this fragment"""
+    try:
+        if api_version == "Base":
+            items = fetch_items()
+        else:
+            # Start over with the first page when the page size changes
+            if st.session_state.rows_limit != limit:
+                st.session_state.rows = []
+                load_page(limit, None)
+                st.session_state.rows_limit = limit
+            items = st.session_state.rows
+
+        if items:
+            # Convert items to an Arrow-backed DataFrame
+            table = to_table(items)
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
+            # Display items in a table
+            st.dataframe(df.head(max_rows), use_container_width=True)
+
+            if len(df) > max_rows:
+                st.caption(f"Showing the first {max_rows} of {len(df)} items")
+                buffer = io.BytesIO()
+                pq.write_table(table, buffer)
+                st.download_button(
+                    "Download full data (Parquet)",
+                    buffer.getvalue(),
+                    file_name="items.parquet",
+                    mime="application/octet-stream"
+                )
+
+            # Navigation controls (only for V1)
+            if api_version == "V1":
+                col1, col2 = st.columns([4, 1])
+
+                with col2:
+                    if st.session_state.cursor:
+                        # Fetch in the fragment body so API errors reach the
+                        # except blocks below, then redraw with the new rows
+                        if st.button("Load More →"):
+                            load_page(limit, st.session_state.cursor)
+                            st.rerun(scope="fragment")
+                    else:
+                        st.info("All items loaded")
+        else:
+            st.info("No items found in the database.")
+
+    except requests.RequestException as e:
+        st.error(f"Error accessing API: {str(e)}")
+    except Exception as e:
+        st.error(f"An error occurred: {str(e)}")
+
+
+items_view(api_version, limit, max_rows)
@@ -0,0 +1,34 @@
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Configure API URL
+API_URL = "https://dynamo-api.dataknowsall.com"  # Update this if your API is running on a different URL
+
+
+def get_http():
+    """HTTP session for the current browser session, reused across reruns"""
+    # Kept per user rather than in st.cache_resource: requests.Session is not
+    # documented as thread-safe, and each user's reruns share one script thread
+    if "http" not in st.session_state:
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+            ),
+        )
+        session.headers["Accept-Encoding"] = "gzip"
+        st.session_state.http = session
+    return st.session_state.http
+
+
+@st.cache_data(ttl=30)
+def load_items():
+    """Get the id and name of all items from API for the dropdown"""
+    response = get_http().get(f"{API_URL}/items", params={"fields": "id,name"}, timeout=5)
+    response.raise_for_status()
+    return response.json()
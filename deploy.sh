@@ -10,8 +10,16 @@ source lvenv/bin/activate
 # Create package directory
 mkdir -p package
 
-# Install dependencies
-pip install -r requirements.txt --target ./package
+# Install dependencies (Lambda needs Linux wheels for compiled packages like orjson)
+pip install -r requirements.txt --target ./package \
+    --platform manylinux2014_x86_64 --implementation cp --python-version 3.9 \
+    --only-binary=:all:
+
+# Drop every botocore service model except DynamoDB if boto3 gets vendored
+# (the Lambda runtime provides boto3, so normally there is nothing to prune)
+if [ -d package/botocore/data ]; then
+    find package/botocore/data -mindepth 1 -maxdepth 1 -type d ! -name dynamodb -exec rm -rf {} +
+fi
 
 # Copy lambda function to package directory
 cp lambda_function.py ./package/
@@ -1,25 +1,82 @@
+import asyncio
 import logging
 import json
+import os
+import threading
 import base64
-from fastapi import FastAPI, HTTPException, Depends, APIRouter, Query
+import hashlib
+import itertools
+import queue
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, APIRouter, Query, Header, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.transform import TransformationInjector
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from mangum import Mangum
+from cachetools import TTLCache
+import orjson
 
 # Configure logging for CloudWatch
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Raise to WARNING in production to skip per-request info records
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
 # Lambda automatically captures logs from stdout/stderr and sends to CloudWatch
 formatter = logging.Formatter(
     "%(asctime)s | %(levelname)s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
 )
 handler = logging.StreamHandler()
 handler.setFormatter(formatter)
-logger.addHandler(handler)
+# The Lambda runtime may already have attached a handler to the root logger;
+# adding another would write every record twice
+if not logger.handlers:
+    logger.addHandler(handler)
 
-app = FastAPI()
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for the Decimal and set values boto3 returns."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize with orjson, falling back to json for ints beyond 64 bits."""
+    try:
+        return orjson.dumps(
+            content, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        return json.dumps(
+            content, default=_json_default, separators=(",", ":")
+        ).encode()
+
+
+class SafeORJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+# Set ENABLE_DOCS=false in production to skip registering the docs routes
+DOCS_ENABLED = os.environ.get("ENABLE_DOCS", "true").lower() == "true"
+
+app = FastAPI(
+    default_response_class=SafeORJSONResponse,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
+    docs_url="/docs" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+)
+# Item JSON repeats attribute names, so it compresses well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 
 # Create v1 router
 v1_router = APIRouter(prefix="/v1")
@@ -28,7 +85,7 @@ v1_router = APIRouter(prefix="/v1")
 @app.get("/")
 async def root():
     logger.info("Root path accessed")
-    logger.info(f"FastAPI root_path: {app.root_path}")
+    logger.info("FastAPI root_path: %s", app.root_path)
     return {
         "routes": [{"path": route.path, "name": route.name} for route in app.routes]
     }
@@ -55,92 +112,428 @@ class PaginatedResponse(BaseModel):
     next_cursor: Optional[str] = None
 
 
-# DynamoDB client setup as a dependency
-def get_dynamodb():
-    logger.info("Initializing DynamoDB connection")
+# Shared keep-alive connection pool and retry policy for all DynamoDB calls
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+
+class _NumberDeserializer(TypeDeserializer):
+    """Deserialize DynamoDB numbers to int/float instead of Decimal."""
+
+    def _deserialize_n(self, value):
+        if "." not in value and "e" not in value and "E" not in value:
+            return int(value)
+        # Up to 15 significant digits round-trip exactly through a float
+        if len(value) <= 15:
+            return float(value)
+        return super()._deserialize_n(value)
+
+
+def _use_number_deserializer(dynamodb) -> None:
+    """Swap the resource's response deserializer for _NumberDeserializer."""
+    injector = TransformationInjector(deserializer=_NumberDeserializer())
+    events = dynamodb.meta.client.meta.events
+    events.unregister("after-call.dynamodb", unique_id="dynamodb-attr-value-output")
+    events.register(
+        "after-call.dynamodb",
+        injector.inject_attribute_value_output,
+        unique_id="dynamodb-attr-value-output",
+    )
+
+
+# Created at import so Lambda's init phase pays for it and warm invocations
+# reuse the same client
+logger.info("Initializing DynamoDB connection")
+try:
+    # Let Lambda use its IAM role
+    _DDB = boto3.resource("dynamodb", region_name="us-east-1", config=DYNAMODB_CONFIG)
+    _use_number_deserializer(_DDB)
+    _TABLE = _DDB.Table("Items")
+except Exception as e:
+    logger.error("Failed to initialize DynamoDB connection: %s", e, exc_info=True)
+    raise
+
+# Open the TLS connection during init with a lookup of a key that never
+# exists. Besides the socket, this loads botocore's lazily built operation
+# model, serializer, parser and retry handler, so the first invocation (or a
+# provisioned-concurrency snapshot) starts with all of them ready. GetItem is
+# used rather than DescribeTable because the execution role only grants item
+# access.
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
     try:
-        # Let Lambda use its IAM role
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-        return dynamodb.Table("Items")
+        _TABLE.get_item(Key={"id": "__warmup__"}, ProjectionExpression="id")
     except Exception as e:
-        logger.error(
-            f"Failed to initialize DynamoDB connection: {str(e)}", exc_info=True
+        logger.warning("DynamoDB connection warm-up failed: %s", e)
+
+
+# Optional GSI (partition key ENTITY_TYPE_ATTRIBUTE, sort key "id") that lets
+# /v1/items page through items with a Query instead of scanning the table
+ITEMS_INDEX = os.environ.get("ITEMS_INDEX")
+ENTITY_TYPE_ATTRIBUTE = "entity_type"
+ENTITY_TYPE = "item"
+
+# Short-lived per-container cache of items by id, invalidated on writes
+ITEM_CACHE_TTL = 30
+_item_cache = TTLCache(maxsize=10_000, ttl=ITEM_CACHE_TTL)
+_item_cache_lock = threading.Lock()
+# Bumped on every invalidation so a read that overlapped a write isn't cached
+_item_cache_generation = 0
+
+# Serialized /v1/items pages keyed by (limit, cursor, fields), cleared on writes
+PAGE_CACHE_TTL = 30
+_page_cache = TTLCache(maxsize=128, ttl=PAGE_CACHE_TTL)
+_page_cache_lock = threading.Lock()
+
+# Media type clients can request on GET /items to stream one item per line
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _projection(fields: Optional[str]) -> Dict[str, Any]:
+    """Build scan kwargs that fetch only the comma-separated attribute names."""
+    names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+    return _project(names)
+
+
+def _project(names: List[str]) -> Dict[str, Any]:
+    """Build read kwargs that fetch only the given attribute names."""
+    if not names:
+        return {}
+    # Use placeholders for every attribute since many (e.g. "name") are reserved
+    placeholders = {f"#f{i}": name for i, name in enumerate(dict.fromkeys(names))}
+    return {
+        "ProjectionExpression": ", ".join(placeholders),
+        "ExpressionAttributeNames": placeholders,
+    }
+
+
+def _get_item_cached(table, item_id: str) -> Optional[Dict[str, Any]]:
+    """Return the item with item_id from the cache, falling back to DynamoDB."""
+    with _item_cache_lock:
+        item = _item_cache.get(item_id)
+        generation = _item_cache_generation
+    if item is None:
+        item = table.get_item(Key={"id": item_id}).get("Item")
+        if item is not None:
+            with _item_cache_lock:
+                # A write may have landed while we read; the result could be stale
+                if _item_cache_generation == generation:
+                    _item_cache[item_id] = item
+    return item
+
+
+def _get_item_property(
+    table, item_id: str, property_name: str
+) -> Optional[Dict[str, Any]]:
+    """Return the item, or just its id and property_name if it is not cached."""
+    with _item_cache_lock:
+        item = _item_cache.get(item_id)
+    if item is None:
+        # Keep the id in the projection so a missing property still returns
+        # an item and can be told apart from a missing item
+        response = table.get_item(
+            Key={"id": item_id}, **_project(["id", property_name])
         )
-        raise
+        item = response.get("Item")
+    return item
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Whether an If-None-Match header value matches etag."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def _is_start_key(key: Any) -> bool:
+    """Whether a decoded cursor has the shape of a LastEvaluatedKey we issued."""
+    expected = {"id", ENTITY_TYPE_ATTRIBUTE} if ITEMS_INDEX else {"id"}
+    return (
+        isinstance(key, dict)
+        and key.keys() == expected
+        and all(isinstance(value, str) for value in key.values())
+    )
+
+
+def _invalidate_item(item_id: Optional[str]) -> None:
+    """Drop cached reads that a write or delete of item_id may have changed."""
+    _invalidate_items([item_id])
+
+
+def _invalidate_items(item_ids: Iterable[Optional[str]]) -> None:
+    """Drop cached reads that writes or deletes of item_ids may have changed."""
+    global _item_cache_generation
+    with _item_cache_lock:
+        _item_cache_generation += 1
+        for item_id in item_ids:
+            _item_cache.pop(item_id, None)
+    with _page_cache_lock:
+        _page_cache.clear()
+
+
+# Documents the raw JSON body that create/update parse themselves
+ITEM_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"type": "object"}}},
+    }
+}
+
+
+def _has_wide_int(value: Any) -> bool:
+    """Whether orjson may have parsed an integer beyond 64 bits into a float."""
+    if isinstance(value, float):
+        return value.is_integer() and abs(value) >= 2**63
+    if isinstance(value, dict):
+        return any(_has_wide_int(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_wide_int(v) for v in value)
+    return False
+
+
+async def _read_body(request: Request) -> Any:
+    """Parse the request body as JSON, skipping pydantic validation."""
+    body = await request.body()
+    try:
+        content = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    # json keeps such integers exact, so they can be written back unchanged
+    if _has_wide_int(content):
+        return json.loads(body)
+    return content
+
+
+async def _read_item(request: Request) -> Dict[str, Any]:
+    item = await _read_body(request)
+    if not isinstance(item, dict):
+        raise HTTPException(status_code=400, detail="Body must be a JSON object")
+    return item
+
+
+async def _read_items(request: Request) -> List[Dict[str, Any]]:
+    items = await _read_body(request)
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        raise HTTPException(
+            status_code=400, detail="Body must be a JSON array of objects"
+        )
+    # Checked up front: batch_writer flushes as it goes, so a bad item found
+    # mid-batch would fail the request after earlier items were written
+    if not all(isinstance(i.get("id"), str) for i in items):
+        raise HTTPException(status_code=400, detail="Every item needs a string id")
+    return items
+
+
+async def _read_item_ids(request: Request) -> List[str]:
+    item_ids = await _read_body(request)
+    if not isinstance(item_ids, list) or not all(isinstance(i, str) for i in item_ids):
+        raise HTTPException(
+            status_code=400, detail="Body must be a JSON array of item IDs"
+        )
+    return item_ids
+
+
+def _batch_put(table, items: List[Dict[str, Any]]) -> None:
+    """Write items with BatchWriteItem, 25 per request, retrying unprocessed."""
+    with table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
+        for item in items:
+            batch.put_item(Item=item)
+
+
+def _batch_delete(table, item_ids: List[str]) -> None:
+    """Delete items with BatchWriteItem, 25 per request, retrying unprocessed."""
+    with table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
+        for item_id in item_ids:
+            batch.delete_item(Key={"id": item_id})
+
+
+# Number of parallel segments used when scanning the whole table
+SCAN_SEGMENTS = 4
+
+
+def _scan_pages(
+    table, segment: int, total_segments: int, projection: Dict[str, Any]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield one segment of the table a page at a time, following LastEvaluatedKey."""
+    scan_kwargs = {"Segment": segment, "TotalSegments": total_segments, **projection}
+    while True:
+        response = table.scan(**scan_kwargs)
+        yield response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            return
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _scan_segment(
+    table, segment: int, total_segments: int, projection: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Scan one segment of the table to the end."""
+    pages = _scan_pages(table, segment, total_segments, projection)
+    return [item for page in pages for item in page]
+
+
+def _parallel_scan(
+    table, projection: Dict[str, Any], total_segments: int = SCAN_SEGMENTS
+) -> List[Dict[str, Any]]:
+    """Scan every segment concurrently and return all items in the table."""
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        chunks = executor.map(
+            lambda segment: _scan_segment(table, segment, total_segments, projection),
+            range(total_segments),
+        )
+        return [item for chunk in chunks for item in chunk]
+
+
+def _stream_scan(
+    table, projection: Dict[str, Any], total_segments: int = SCAN_SEGMENTS
+) -> Iterator[bytes]:
+    """Scan every segment concurrently, yielding NDJSON for each page as it arrives."""
+    # Bounded so segments wait for a slow client instead of buffering the table
+    pages: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(
+        maxsize=2 * total_segments
+    )
+    # Set once the consumer is done, including when the client disconnects
+    stop = threading.Event()
+
+    def put(page: Optional[List[Dict[str, Any]]]) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def scan(segment: int) -> None:
+        try:
+            for page in _scan_pages(table, segment, total_segments, projection):
+                if not put(page):
+                    return
+        except Exception as e:
+            logger.error("Error while streaming segment %s: %s", segment, e)
+            raise
+        finally:
+            # One None per segment tells the consumer that segment is finished
+            put(None)
+
+    executor = ThreadPoolExecutor(max_workers=total_segments)
+    try:
+        futures = [executor.submit(scan, segment) for segment in range(total_segments)]
+        remaining = total_segments
+        while remaining:
+            page = pages.get()
+            if page is None:
+                remaining -= 1
+            elif page:
+                yield b"".join(_dumps(item) + b"\n" for item in page)
+        for future in futures:
+            # Re-raise the first scan error, after the items read before it
+            future.result()
+    finally:
+        stop.set()
+        # Abandoned segments stop at their next page; don't block on them here
+        executor.shutdown(wait=False)
 
 
 # Original routes
 @app.get("/items", response_model=List[Dict[str, Any]])
-async def get_items(table: Any = Depends(get_dynamodb)):
+async def get_items(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated attribute names to return"
+    ),
+    accept: Optional[str] = Header(None),
+):
     logger.info("Handling GET request for all items")
-    # Add request path logging
-    logger.info("FastAPI root_path: %s", app.root_path)
-    logger.info("FastAPI routes: %s", [route.path for route in app.routes])
     try:
-        response = table.scan()
-        items = response.get("Items", [])
-        logger.info(f"Successfully retrieved {len(items)} items")
-        return items
+        if accept and NDJSON_MEDIA_TYPE in accept:
+            # Pages are written as the scan returns them instead of after it.
+            # Reading the first one here lets an early DynamoDB error still
+            # return a 500 before the response has started.
+            chunks = _stream_scan(_TABLE, _projection(fields))
+            first = await asyncio.to_thread(next, chunks, b"")
+            return StreamingResponse(
+                itertools.chain([first], chunks), media_type=NDJSON_MEDIA_TYPE
+            )
+        items = await asyncio.to_thread(_parallel_scan, _TABLE, _projection(fields))
+        logger.info("Successfully retrieved %s items", len(items))
+        return SafeORJSONResponse(items)
     except ClientError as e:
-        logger.error(f"DynamoDB error while fetching items: {str(e)}", exc_info=True)
+        logger.error("DynamoDB error while fetching items: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error while fetching items: {str(e)}", exc_info=True)
+        logger.error("Unexpected error while fetching items: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/items/{item_id}")
-async def get_item(item_id: str, table: Any = Depends(get_dynamodb)):
-    logger.info(f"Handling GET request for item ID: {item_id}")
+async def get_item(item_id: str, if_none_match: Optional[str] = Header(None)):
+    logger.info("Handling GET request for item ID: %s", item_id)
     try:
-        response = table.get_item(Key={"id": item_id})
-        item = response.get("Item")
+        item = await asyncio.to_thread(_get_item_cached, _TABLE, item_id)
         if not item:
-            logger.warning(f"Item not found with ID: {item_id}")
+            logger.warning("Item not found with ID: %s", item_id)
             raise HTTPException(status_code=404, detail="Item not found")
-        logger.info(f"Successfully retrieved item: {item_id}")
-        return item
+        # Serialize once and hash the same bytes that are sent
+        body = _dumps(item)
+        etag = _etag(body)
+        if if_none_match and _etag_matches(etag, if_none_match):
+            logger.info("Item %s not modified", item_id)
+            return Response(status_code=304, headers={"ETag": etag})
+        logger.info("Successfully retrieved item: %s", item_id)
+        return Response(body, media_type="application/json", headers={"ETag": etag})
     except ClientError as e:
         logger.error(
-            f"DynamoDB error while fetching item {item_id}: {str(e)}", exc_info=True
+            "DynamoDB error while fetching item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error while fetching item {item_id}: {str(e)}", exc_info=True
+            "Unexpected error while fetching item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/items/{item_id}/{property_name}")
-async def get_item_property(
-    item_id: str, property_name: str, table: Any = Depends(get_dynamodb)
-):
+async def get_item_property(item_id: str, property_name: str):
     logger.info(
-        f"Handling GET request for item ID: {item_id}, property: {property_name}"
+        "Handling GET request for item ID: %s, property: %s", item_id, property_name
     )
     try:
-        response = table.get_item(Key={"id": item_id})
-        item = response.get("Item")
+        item = await asyncio.to_thread(
+            _get_item_property, _TABLE, item_id, property_name
+        )
         if not item:
-            logger.warning(f"Item not found with ID: {item_id}")
+            logger.warning("Item not found with ID: %s", item_id)
             raise HTTPException(status_code=404, detail="Item not found")
 
         if property_name not in item:
-            logger.warning(f"Property '{property_name}' not found for item {item_id}")
+            logger.warning(
+                "Property '%s' not found for item %s", property_name, item_id
+            )
             raise HTTPException(
                 status_code=404, detail=f"Property '{property_name}' not found"
             )
 
         logger.info(
-            f"Successfully retrieved property {property_name} for item {item_id}"
+            "Successfully retrieved property %s for item %s", property_name, item_id
         )
-        return {property_name: item[property_name]}
+        return SafeORJSONResponse({property_name: item[property_name]})
     except ClientError as e:
         logger.error(
-            f"DynamoDB error while fetching property {property_name} for item {item_id}: {str(e)}",
+            "DynamoDB error while fetching property %s for item %s: %s",
+            property_name,
+            item_id,
+            e,
             exc_info=True,
         )
         raise HTTPException(status_code=500, detail=str(e))
@@ -148,64 +541,102 @@ async def get_item_property(
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error while fetching property {property_name} for item {item_id}: {str(e)}",
+            "Unexpected error while fetching property %s for item %s: %s",
+            property_name,
+            item_id,
+            e,
             exc_info=True,
         )
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.post("/items", status_code=201)
-async def create_item(item: Dict[str, Any], table: Any = Depends(get_dynamodb)):
-    logger.info(f"Handling POST request to create item with ID: {item.get('id')}")
+@app.post("/items", status_code=201, openapi_extra=ITEM_REQUEST_BODY)
+async def create_item(
+    request: Request,
+    batch: bool = Query(
+        False, description="Treat the body as a JSON array of items to write"
+    ),
+):
+    if batch:
+        return await _create_items(await _read_items(request))
+
+    item = await _read_item(request)
+    logger.info("Handling POST request to create item with ID: %s", item.get("id"))
     try:
-        table.put_item(Item=item)
-        logger.info(f"Successfully created item with ID: {item.get('id')}")
-        return item
+        if ITEMS_INDEX:
+            item[ENTITY_TYPE_ATTRIBUTE] = ENTITY_TYPE
+        await asyncio.to_thread(_TABLE.put_item, Item=item)
+        _invalidate_item(item["id"])
+        logger.info("Successfully created item with ID: %s", item.get("id"))
+        return SafeORJSONResponse(item, status_code=201)
     except ClientError as e:
-        logger.error(f"DynamoDB error while creating item: {str(e)}", exc_info=True)
+        logger.error("DynamoDB error while creating item: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error while creating item: {str(e)}", exc_info=True)
+        logger.error("Unexpected error while creating item: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.put("/items/{item_id}")
-async def update_item(
-    item_id: str, item: Dict[str, Any], table: Any = Depends(get_dynamodb)
-):
-    logger.info(f"Handling PUT request to update item ID: {item_id}")
+async def _create_items(items: List[Dict[str, Any]]):
+    logger.info("Handling POST request to create %s items", len(items))
+    try:
+        if ITEMS_INDEX:
+            for item in items:
+                item[ENTITY_TYPE_ATTRIBUTE] = ENTITY_TYPE
+        await asyncio.to_thread(_batch_put, _TABLE, items)
+        logger.info("Successfully created %s items", len(items))
+        return SafeORJSONResponse(items, status_code=201)
+    except ClientError as e:
+        logger.error("DynamoDB error while creating items: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error while creating items: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        # A failed batch may still have written some items
+        _invalidate_items(item["id"] for item in items)
+
+
+@app.put("/items/{item_id}", openapi_extra=ITEM_REQUEST_BODY)
+async def update_item(item_id: str, request: Request):
+    item = await _read_item(request)
+    logger.info("Handling PUT request to update item ID: %s", item_id)
     try:
         item["id"] = item_id
-        table.put_item(Item=item)
-        logger.info(f"Successfully updated item: {item_id}")
-        return item
+        if ITEMS_INDEX:
+            item[ENTITY_TYPE_ATTRIBUTE] = ENTITY_TYPE
+        await asyncio.to_thread(_TABLE.put_item, Item=item)
+        _invalidate_item(item["id"])
+        logger.info("Successfully updated item: %s", item_id)
+        return SafeORJSONResponse(item)
     except ClientError as e:
         logger.error(
-            f"DynamoDB error while updating item {item_id}: {str(e)}", exc_info=True
+            "DynamoDB error while updating item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(
-            f"Unexpected error while updating item {item_id}: {str(e)}", exc_info=True
+            "Unexpected error while updating item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.delete("/items/{item_id}", status_code=204)
-async def delete_item(item_id: str, table: Any = Depends(get_dynamodb)):
-    logger.info(f"Handling DELETE request for item ID: {item_id}")
+async def delete_item(item_id: str):
+    logger.info("Handling DELETE request for item ID: %s", item_id)
     try:
-        table.delete_item(Key={"id": item_id})
-        logger.info(f"Successfully deleted item: {item_id}")
+        await asyncio.to_thread(_TABLE.delete_item, Key={"id": item_id})
+        _invalidate_item(item_id)
+        logger.info("Successfully deleted item: %s", item_id)
         return None
     except ClientError as e:
         logger.error(
-            f"DynamoDB error while deleting item {item_id}: {str(e)}", exc_info=True
+            "DynamoDB error while deleting item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(
-            f"Unexpected error while deleting item {item_id}: {str(e)}", exc_info=True
+            "Unexpected error while deleting item %s: %s", item_id, e, exc_info=True
         )
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -219,6 +650,7 @@ async def delete_item(item_id: str, table: Any = Depends(get_dynamodb)):
 Fetch a paginated list of items from the DynamoDB table.
 - Use the `limit` parameter to specify the number of items to fetch.
 - Use the `cursor` parameter for pagination, to fetch the next set of items.
+- Use the `fields` parameter to return only the listed attributes.
 """,
 )
 async def get_items_v1(
@@ -228,70 +660,139 @@ async def get_items_v1(
     cursor: Optional[str] = Query(
         None, description="Pagination cursor for fetching the next set of items"
     ),
-    table: Any = Depends(get_dynamodb),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated attribute names to return"
+    ),
 ):
     logger.info(
-        f"Handling GET request for items with limit {limit} and cursor {cursor}"
+        "Handling GET request for items with limit %s and cursor %s", limit, cursor
     )
+    page_key = (limit, cursor, fields)
+    with _page_cache_lock:
+        body = _page_cache.get(page_key)
+    if body is not None:
+        logger.info("Serving cached page for cursor %s", cursor)
+        return Response(content=body, media_type="application/json")
+
     try:
-        scan_kwargs = {"Limit": limit}
+        scan_kwargs = {"Limit": limit, **_projection(fields)}
 
         if cursor:
             try:
-                last_evaluated_key = json.loads(
-                    base64.b64decode(cursor.encode()).decode()
-                )
+                last_evaluated_key = orjson.loads(base64.urlsafe_b64decode(cursor))
+                if not _is_start_key(last_evaluated_key):
+                    raise ValueError(f"not a start key: {last_evaluated_key!r}")
                 scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
             except Exception as e:
-                logger.error(f"Invalid cursor format: {str(e)}")
+                logger.error("Invalid cursor format: %s", e)
                 raise HTTPException(status_code=400, detail="Invalid cursor format")
 
-        response = table.scan(**scan_kwargs)
+        if ITEMS_INDEX:
+            response = await asyncio.to_thread(
+                _TABLE.query,
+                IndexName=ITEMS_INDEX,
+                KeyConditionExpression=Key(ENTITY_TYPE_ATTRIBUTE).eq(ENTITY_TYPE),
+                **scan_kwargs,
+            )
+        else:
+            response = await asyncio.to_thread(_TABLE.scan, **scan_kwargs)
         items = response.get("Items", [])
 
         next_cursor = None
         if "LastEvaluatedKey" in response:
-            next_cursor = base64.b64encode(
-                json.dumps(response["LastEvaluatedKey"]).encode()
-            ).decode()
-
-        logger.info(f"Successfully retrieved {len(items)} items")
-        return PaginatedResponse(items=items, next_cursor=next_cursor)
+            next_cursor = base64.urlsafe_b64encode(
+                _dumps(response["LastEvaluatedKey"])
+            ).decode("ascii")
+
+        logger.info("Successfully retrieved %s items", len(items))
+        body = _dumps({"items": items, "next_cursor": next_cursor})
+        with _page_cache_lock:
+            _page_cache[page_key] = body
+        return Response(content=body, media_type="application/json")
     except ClientError as e:
-        logger.error(f"DynamoDB error while fetching items: {str(e)}", exc_info=True)
+        logger.error("DynamoDB error while fetching items: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error while fetching items: {str(e)}", exc_info=True)
+        logger.error("Unexpected error while fetching items: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@v1_router.get("/items/{item_id}")
-async def get_item_v1(item_id: str, table: Any = Depends(get_dynamodb)):
-    return await get_item(item_id, table)
-
-
-@v1_router.get("/items/{item_id}/{property_name}")
-async def get_item_property_v1(
-    item_id: str, property_name: str, table: Any = Depends(get_dynamodb)
-):
-    return await get_item_property(item_id, property_name, table)
-
-
-@v1_router.post("/items", status_code=201)
-async def create_item_v1(item: Dict[str, Any], table: Any = Depends(get_dynamodb)):
-    return await create_item(item, table)
-
-
-@v1_router.put("/items/{item_id}")
-async def update_item_v1(
-    item_id: str, item: Dict[str, Any], table: Any = Depends(get_dynamodb)
-):
-    return await update_item(item_id, item, table)
+@v1_router.post(
+    "/items:batch",
+    status_code=201,
+    summary="Create or replace items in bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}}
+                }
+            },
+        }
+    },
+)
+async def create_items_batch_v1(request: Request):
+    return await _create_items(await _read_items(request))
+
+
+@v1_router.delete(
+    "/items:batch",
+    status_code=204,
+    summary="Delete items in bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "string"}}
+                }
+            },
+        }
+    },
+)
+async def delete_items_batch_v1(request: Request):
+    item_ids = await _read_item_ids(request)
+    logger.info("Handling DELETE request for %s items", len(item_ids))
+    try:
+        await asyncio.to_thread(_batch_delete, _TABLE, item_ids)
+        logger.info("Successfully deleted %s items", len(item_ids))
+        return None
+    except ClientError as e:
+        logger.error("DynamoDB error while deleting items: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error while deleting items: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        # A failed batch may still have deleted some items
+        _invalidate_items(item_ids)
 
 
-@v1_router.delete("/items/{item_id}", status_code=204)
-async def delete_item_v1(item_id: str, table: Any = Depends(get_dynamodb)):
-    return await delete_item(item_id, table)
+# The single-item v1 routes share the root handlers directly rather than
+# wrapping them, so each call resolves its parameters only once.
+v1_router.add_api_route("/items/{item_id}", get_item, methods=["GET"])
+v1_router.add_api_route(
+    "/items/{item_id}/{property_name}", get_item_property, methods=["GET"]
+)
+v1_router.add_api_route(
+    "/items",
+    create_item,
+    methods=["POST"],
+    status_code=201,
+    openapi_extra=ITEM_REQUEST_BODY,
+)
+v1_router.add_api_route(
+    "/items/{item_id}",
+    update_item,
+    methods=["PUT"],
+    openapi_extra=ITEM_REQUEST_BODY,
+)
+v1_router.add_api_route(
+    "/items/{item_id}", delete_item, methods=["DELETE"], status_code=204
+)
 
 
 # Include v1 router in the main app
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from api_client import API_URL, get_http, load_items
 
 # Configure the page
 st.set_page_config(page_title="Edit Item", layout="wide")
@@ -8,28 +9,30 @@ st.set_page_config(page_title="Edit Item", layout="wide")
 st.title("Edit Item")
 st.markdown("Edit an existing item in the database")
 
-# Configure API URL
-API_URL = "https://dynamo-api.dataknowsall.com"  # Update this if your Flask API is running on a different URL
 
-try:
-    # Get all items from API
-    response = requests.get(f"{API_URL}/items")
+@st.cache_data(ttl=30)
+def _load_item(item_id):
+    """Fetch the full item being edited"""
+    response = get_http().get(f"{API_URL}/items/{item_id}", timeout=5)
     response.raise_for_status()
-    items = response.json()
+    return response.json()
+
+
+try:
+    items = load_items()
     
     if not items:
         st.warning("No items found in the database.")
     else:
         # Create a dropdown to select an item to edit
-        item_names = {f"{item['id']} - {item['name']}": item for item in items}
-        selected_item_key = st.selectbox(
+        selected_index = st.selectbox(
             "Select an item to edit",
-            options=list(item_names.keys()),
-            format_func=lambda x: x.split(" - ")[1]  # Show only the name in the dropdown
+            options=range(len(items)),
+            format_func=lambda i: items[i]['name']  # Show only the name in the dropdown
         )
         
-        if selected_item_key:
-            selected_item = item_names[selected_item_key]
+        if selected_index is not None:
+            selected_item = _load_item(items[selected_index]['id'])
             
             # Create a form for editing the item
             with st.form("edit_item_form"):
@@ -52,10 +55,14 @@ try:
                         }
                         
                         # Update item using API
-                        response = requests.put(f"{API_URL}/items/{selected_item['id']}", json=updated_item)
+                        response = get_http().put(f"{API_URL}/items/{selected_item['id']}", json=updated_item, timeout=5)
                         response.raise_for_status()
                         
                         st.success("Item updated successfully!")
+
+                        # Drop cached data so the next run shows the update
+                        load_items.clear()
+                        _load_item.clear()
                         
                         # Rerun the app to refresh the data
                         # st.rerun()
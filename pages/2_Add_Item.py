@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from api_client import API_URL, get_http, load_items
 import uuid
 
 # Configure the page
@@ -9,9 +10,6 @@ st.set_page_config(page_title="Add New Item", layout="wide")
 st.title("Add New Item")
 st.markdown("Add a new item to the database")
 
-# Configure API URL
-API_URL = "https://dynamo-api.dataknowsall.com"  # Update this if your Flask API is running on a different URL
-
 # Create a form for adding new items
 with st.form("add_item_form"):
     # Generate a random UUID for the ID field
@@ -34,10 +32,13 @@ with st.form("add_item_form"):
             }
             
             # Add item using API
-            response = requests.post(f"{API_URL}/items", json=item)
+            response = get_http().post(f"{API_URL}/items", json=item, timeout=5)
             response.raise_for_status()
             
             st.success("Item added successfully!")
+
+            # Drop the cached list so the Edit and Delete pages show the new item
+            load_items.clear()
             
             # Clear the form by rerunning the app
             # st.rerun()
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from api_client import API_URL, get_http, load_items
 
 # Configure the page
 st.set_page_config(page_title="Delete Item", layout="wide")
@@ -8,28 +9,22 @@ st.set_page_config(page_title="Delete Item", layout="wide")
 st.title("Delete Item")
 st.markdown("Delete an existing item from the database")
 
-# Configure API URL
-API_URL = "https://dynamo-api.dataknowsall.com"  # Update this if your Flask API is running on a different URL
 
 try:
-    # Get all items from API
-    response = requests.get(f"{API_URL}/items")
-    response.raise_for_status()
-    items = response.json()
+    items = load_items()
     
     if not items:
         st.warning("No items found in the database.")
     else:
         # Create a dropdown to select an item to delete
-        item_names = {f"{item['id']} - {item['name']}": item for item in items}
-        selected_item_key = st.selectbox(
+        selected_index = st.selectbox(
             "Select an item to delete",
-            options=list(item_names.keys()),
-            format_func=lambda x: x.split(" - ")[1]  # Show only the name in the dropdown
+            options=range(len(items)),
+            format_func=lambda i: items[i]['name']  # Show only the name in the dropdown
         )
         
-        if selected_item_key:
-            selected_item = item_names[selected_item_key]
+        if selected_index is not None:
+            selected_item = items[selected_index]
             
             # Display item details
             st.subheader("Item Details")
@@ -41,10 +36,13 @@ try:
             if st.button("Delete Item", type="primary"):
                 try:
                     # Delete item using API
-                    response = requests.delete(f"{API_URL}/items/{selected_item['id']}")
+                    response = get_http().delete(f"{API_URL}/items/{selected_item['id']}", timeout=5)
                     response.raise_for_status()
                     
                     st.success("Item deleted successfully!")
+
+                    # Drop the cached list so the next run no longer shows the item
+                    load_items.clear()
                     
                     # Rerun the app to refresh the data
                     # st.rerun()